@@ -6,7 +6,6 @@ from pathlib import Path
 import deepl
 from dotenv import load_dotenv
 import os
-from ttkthemes import ThemedTk, ThemedStyle
 from tkinter import ttk
 from enums.menu_option_label_enum import MenuOptionLabelEnum
 from enums.action_enum import ActionEnum
@@ -16,13 +15,77 @@ from utils.logging_config import configure_logging
 import sys
 import re
 from utils.utils import TypeUtils
+import threading
 import time
+import bisect
+import contextlib
+import functools
+import hashlib
+import tempfile
+from collections import OrderedDict, deque
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ttkthemes import ThemedTk, ThemedStyle
+except ImportError:
+    # Fall back to the stock Tk look when ttkthemes is not installed.
+    class ThemedTk(tk.Tk):
+        def __init__(self, *args, theme=None, **kwargs):
+            super().__init__(*args, **kwargs)
+
+    class ThemedStyle(ttk.Style):
+        def set_theme(self, theme_name):
+            pass
+
 
-load_dotenv()
-DEEPL_API_KEY = os.getenv("DEEPL_API_KEY")
-translator = deepl.Translator(DEEPL_API_KEY)
+translator = None
 
 CONFIG_PATH = Path.home() / ".translation_app_config.json"
+CACHE_PATH = Path.home() / ".translation_app_cache.json"
+# Set TRANSLATION_APP_QUIET=1 to suppress informational popups (benchmarks, CI)
+QUIET = os.getenv("TRANSLATION_APP_QUIET", "").strip().lower() in ("1", "true", "yes")
+
+# Parsed JSON keyed by (real path, mtime_ns, size); see load_json.
+_JSON_CACHE = OrderedDict()
+_JSON_CACHE_SIZE = 8
+_JSON_CACHE_LOCK = threading.Lock()
+
+_NO_EN_LABEL = "[EN] (no translation)"
+# Upper bounds of texts and (approximate) text bytes per DeepL request
+_BATCH_SIZE = 50
+_BATCH_BYTES = 120 * 1024
+# Oldest undo/redo steps are dropped past this many
+_UNDO_LIMIT = 200
+
+
+class RequestThrottle:
+    """Limit concurrent DeepL requests and space out their start times."""
+
+    interval = 0.05
+    max_concurrent = 10
+    slots = threading.BoundedSemaphore(max_concurrent)
+    lock = threading.Lock()
+    next_at = 0.0
+
+    @classmethod
+    @contextlib.contextmanager
+    def request(cls):
+        with cls.slots:
+            cls.wait()
+            yield
+
+    @classmethod
+    def wait(cls):
+        with cls.lock:
+            now = time.monotonic()
+            delay = cls.next_at - now
+            cls.next_at = max(now, cls.next_at) + cls.interval
+        if delay > 0:
+            time.sleep(delay)
 
 
 class DeepLUsageCache:
@@ -30,10 +93,120 @@ class DeepLUsageCache:
     ts = 0.0
 
 
-def get_deepl_usage(translator: deepl.Translator):
+class UndoOp:
+    """
+    One undo/redo step. Each action is a subclass with slots for its own fields;
+    the fields it does not use read as None from here.
+    """
+
+    __slots__ = ()
+    action = None
+    parts = pl = en = None
+    old_parts = new_parts = old_pl = old_en = new_pl = new_en = None
+
+
+class AddOp(UndoOp):
+    __slots__ = ("parts", "pl", "en")
+    action = ActionEnum.Add.value
+
+    def __init__(self, parts, pl, en=""):
+        self.parts = parts
+        self.pl = pl
+        self.en = en
+
+
+class DeleteOp(UndoOp):
+    __slots__ = ("parts", "old_pl", "old_en")
+    action = ActionEnum.Delete.value
+
+    def __init__(self, parts, old_pl, old_en):
+        self.parts = parts
+        self.old_pl = old_pl
+        self.old_en = old_en
+
+
+class EditOp(UndoOp):
+    __slots__ = ("old_parts", "new_parts", "old_pl", "old_en", "new_pl", "new_en")
+    action = ActionEnum.Edit.value
+
+    def __init__(self, old_parts, new_parts, old_pl, old_en, new_pl, new_en=""):
+        self.old_parts = old_parts
+        self.new_parts = new_parts
+        self.old_pl = old_pl
+        self.old_en = old_en
+        self.new_pl = new_pl
+        self.new_en = new_en
+
+
+class TranslationCache:
+    """DeepL results stored in CACHE_PATH, keyed by language pair and source text."""
+
+    entries = None
+    dirty = False
+    max_entries = 20000
+    # get/put run on the translation worker threads
+    lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text, source_lang, target_lang):
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        return f"{source_lang}|{target_lang}|{digest}"
+
+    @classmethod
+    def _load(cls):
+        if cls.entries is None:
+            cls.entries = load_json(CACHE_PATH) if CACHE_PATH.is_file() else {}
+        return cls.entries
+
+    @classmethod
+    def get(cls, text, source_lang, target_lang):
+        key = cls.make_key(text, source_lang, target_lang)
+        with cls.lock:
+            entries = cls._load()
+            result = entries.pop(key, None)
+            if result is not None:
+                entries[key] = result
+        return result
+
+    @classmethod
+    def put(cls, text, source_lang, target_lang, result):
+        if result:
+            key = cls.make_key(text, source_lang, target_lang)
+            with cls.lock:
+                entries = cls._load()
+                entries.pop(key, None)
+                entries[key] = result
+                while len(entries) > cls.max_entries:
+                    del entries[next(iter(entries))]
+                cls.dirty = True
+
+    @classmethod
+    def save(cls):
+        if cls.dirty:
+            try:
+                with cls.lock:
+                    save_json(cls.entries, CACHE_PATH)
+                    cls.dirty = False
+            except OSError as e:
+                logging.error("Error saving translation cache: %s", e, exc_info=True)
+
+
+def get_translator():
+    """Create the DeepL client on first use instead of at import time."""
+    global translator
+    if translator is None:
+        load_dotenv()
+        try:
+            translator = deepl.Translator(os.getenv("DEEPL_API_KEY"))
+        except ValueError as e:
+            raise deepl.AuthorizationException(f"DeepL is not configured: {e}")
+    return translator
+
+
+def get_deepl_usage(translator: deepl.Translator = None):
     """Return (used, limit) or (None, None) on error."""
     try:
-        u = translator.get_usage()
+        u = (translator or get_translator()).get_usage()
         if u and u.character:
             return u.character.count or 0, u.character.limit or 0
     except Exception as e:
@@ -41,7 +214,7 @@ def get_deepl_usage(translator: deepl.Translator):
     return None, None
 
 
-def get_remaining_quota(translator: deepl.Translator):
+def get_remaining_quota(translator: deepl.Translator = None):
     """Return (remaining, used, limit) or (None, None, None) if unknown."""
     used, limit = get_deepl_usage(translator)
     if used is None or limit is None:
@@ -51,53 +224,216 @@ def get_remaining_quota(translator: deepl.Translator):
 
 def refresh_usage_cache():
     """Update global cache synchronously; return (remaining, used, limit)."""
-    rem, used, limit = get_remaining_quota(translator)
+    rem, used, limit = get_remaining_quota()
     DeepLUsageCache.value = (rem, used, limit)
     DeepLUsageCache.ts = time.time()
     return DeepLUsageCache.value
 
 
+def notify(title, message):
+    """Show an informational popup unless QUIET is set."""
+    if not QUIET:
+        messagebox.showinfo(title, message)
+
+
 def estimate_char_cost(text: str) -> int:
     return len(text or "")
 
 
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_APPEND_NEWLINE,
+        )
+
+else:
+    _loads = json.loads
+
+    def _dumps(data) -> bytes:
+        return (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
 def load_json(path):
+    """Parse a JSON file, reusing the cached result while the file is unchanged.
+
+    Callers get their own copy, so mutating the result never leaks into the cache.
+    Files written by save_json are cached as their raw bytes, so loading them
+    again skips the disk read.
+    """
     path = Path(path)
 
     try:
-        text = path.read_text(encoding="utf-8")
+        st = path.stat()
+        cache_key = (os.path.realpath(path), st.st_mtime_ns, st.st_size)
+        with _JSON_CACHE_LOCK:
+            cached = _JSON_CACHE.get(cache_key)
+            if cached is not None:
+                _JSON_CACHE.move_to_end(cache_key)
+        if cached is None:
+            raw = path.read_bytes()
+        elif isinstance(cached, bytes):
+            raw = cached
+        else:
+            return _copy_json(cached)
     except FileNotFoundError:
         logging.warning(f"File not found: {path}")
         return {}
-    except UnicodeDecodeError as e:
-        logging.error(f"Encoding error reading file {path}: {e}")
-        return {}
     except OSError as e:
         logging.error(f"Failed reading the file {path}: {e}")
         return {}
 
     try:
-        return json.loads(text)
+        data = _loads(raw)
+    except UnicodeDecodeError as e:
+        logging.error(f"Encoding error reading file {path}: {e}")
+        return {}
     except json.JSONDecodeError as e:
         logging.error(f"Invalid JSON format in file {path}: {e}")
         return {}
 
+    _cache_json(cache_key, data)
+    return _copy_json(data)
+
+
+def _copy_json(obj):
+    """Copy parsed JSON. Only dicts and lists are mutable, so only they are copied."""
+    if type(obj) is dict:
+        return {k: _copy_json(v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [_copy_json(v) for v in obj]
+    return obj
+
+
+def load_json_files(*paths):
+    """Load several JSON files concurrently; results follow the order of paths."""
+    with concurrent.futures.ThreadPoolExecutor(len(paths)) as pool:
+        return list(pool.map(load_json, paths))
+
+
+def _cache_json(cache_key, value):
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[cache_key] = value
+        _JSON_CACHE.move_to_end(cache_key)
+        if len(_JSON_CACHE) > _JSON_CACHE_SIZE:
+            _JSON_CACHE.popitem(last=False)
+
+
+def _invalidate_json_cache(path):
+    real = os.path.realpath(path)
+    with _JSON_CACHE_LOCK:
+        for key in [k for k in _JSON_CACHE if k[0] == real]:
+            del _JSON_CACHE[key]
+
 
 def save_json(data, path):
-    Path(path).write_text(
-        json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
-    )
+    """Write data as JSON atomically: into a temporary file, then os.replace."""
+    _write_bytes(_dumps(data), path)
+
+
+def _digest(raw):
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _write_bytes(raw, path):
+    _invalidate_json_cache(path)
+    target = os.path.realpath(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".tmp")
+    view = memoryview(raw)
+    try:
+        try:
+            while view:
+                view = view[os.write(fd, view) :]
+            # Make sure the data is on disk before the rename makes it visible
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        try:
+            mode = os.stat(target).st_mode
+        except FileNotFoundError:
+            # mkstemp creates the file as 0600; give new files the usual 0644
+            mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+        st = os.stat(target)
+        _cache_json((target, st.st_mtime_ns, st.st_size), raw)
+    except BaseException:
+        # Never leave a half-written temporary file next to the original
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 def translate_text(text, source_lang="PL", target_lang="EN-GB"):
+    cached = TranslationCache.get(text, source_lang, target_lang)
+    if cached:
+        return cached
     try:
-        result = translator.translate_text(
-            text, source_lang=source_lang, target_lang=target_lang
-        )
-        return result.text
+        with RequestThrottle.request():
+            result = get_translator().translate_text(
+                text, source_lang=source_lang, target_lang=target_lang
+            )
     except deepl.DeepLException as e:
         logging.error("DeepL translation error: %s", e, exc_info=True)
         return ""
+    TranslationCache.put(text, source_lang, target_lang, result.text)
+    return result.text
+
+
+def _chunks(texts):
+    """Yield slices of texts that fit DeepL's per-request count and size limits."""
+    start = size = 0
+    for i, text in enumerate(texts):
+        length = len(text.encode("utf-8"))
+        if i > start and (i - start >= _BATCH_SIZE or size + length > _BATCH_BYTES):
+            yield start, i
+            start = i
+            size = 0
+        size += length
+    if start < len(texts):
+        yield start, len(texts)
+
+
+def translate_texts(texts, source_lang="PL", target_lang="EN-GB"):
+    """Translate several texts with as few DeepL requests as possible.
+
+    Texts already in TranslationCache are not sent; the rest go out in
+    requests of at most _BATCH_SIZE texts and roughly _BATCH_BYTES of text.
+    Returns one string per input; texts that could not be translated come
+    back empty.
+    """
+    out = [TranslationCache.get(text, source_lang, target_lang) for text in texts]
+    missing = [i for i, cached in enumerate(out) if not cached]
+    for start, stop in _chunks([texts[i] for i in missing]):
+        chunk = missing[start:stop]
+        try:
+            with RequestThrottle.request():
+                results = get_translator().translate_text(
+                    [texts[i] for i in chunk],
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                )
+        except deepl.DeepLException as e:
+            logging.error("DeepL translation error: %s", e, exc_info=True)
+            continue
+        for i, result in zip(chunk, results):
+            out[i] = result.text
+            TranslationCache.put(texts[i], source_lang, target_lang, result.text)
+    return [text or "" for text in out]
 
 
 class AddDialog(simpledialog.Dialog):
@@ -126,8 +462,9 @@ class AddDialog(simpledialog.Dialog):
 
     def body(self, master):
         toplevel = master.winfo_toplevel()
-        style = ThemedStyle(toplevel)
-        style.set_theme("equilux")
+        # The root window already runs the equilux theme; styles are shared
+        # per interpreter, so only look up colours instead of reloading it.
+        style = ttk.Style(toplevel)
         bg = style.lookup("TFrame", "background")
         master.configure(background=bg)
         toplevel.configure(background=bg)
@@ -305,40 +642,185 @@ class AddDialog(simpledialog.Dialog):
 def set_nested(d, keys, value):
     cur = d
     for k in keys[:-1]:
-        if k not in cur or not isinstance(cur[k], dict):
-            cur[k] = {}
-        cur = cur[k]
+        nxt = cur.get(k)
+        if not isinstance(nxt, dict):
+            nxt = cur[k] = {}
+        cur = nxt
     cur[keys[-1]] = value
 
 
+def set_nested_pair(pl, en, keys, pl_value, en_value):
+    """set_nested on the PL and EN trees in a single walk down keys."""
+    for k in keys[:-1]:
+        nxt = pl.get(k)
+        if not isinstance(nxt, dict):
+            nxt = pl[k] = {}
+        pl = nxt
+        nxt = en.get(k)
+        if not isinstance(nxt, dict):
+            nxt = en[k] = {}
+        en = nxt
+    pl[keys[-1]] = pl_value
+    en[keys[-1]] = en_value
+
+
+_MISSING = object()
+
+
 def get_nested(d, keys):
     cur = d
     for k in keys:
-        if isinstance(cur, dict) and k in cur:
-            cur = cur[k]
-        else:
+        cur = cur.get(k, _MISSING) if isinstance(cur, dict) else _MISSING
+        if cur is _MISSING:
             return ""
     return cur if not isinstance(cur, dict) else ""
 
 
-def flatten_to_nested(d: dict) -> dict:
-    result = {}
-    for key, value in d.items():
-        if isinstance(value, dict):
-            nested = flatten_to_nested(value)
-            if key not in result or not isinstance(result[key], dict):
-                result[key] = nested
+def iter_leaf_pairs(pl_data, en_data):
+    """Yield (pl, en) for every string leaf of pl_data with a string EN match."""
+    stack = [(pl_data, en_data)]
+    while stack:
+        cur, en_cur = stack.pop()
+        for key, val in cur.items():
+            en_val = en_cur.get(key)
+            if isinstance(val, dict):
+                if isinstance(en_val, dict):
+                    stack.append((val, en_val))
+            elif isinstance(val, str) and isinstance(en_val, str):
+                yield val, en_val
+
+
+def collect_keys(*trees):
+    """
+    Return the dotted keys that hold a non-empty leaf value in any of trees.
+    Branches are left out, matching get_nested, which returns "" for a dict.
+    """
+    keys = set()
+    for tree in trees:
+        stack = [("", tree)]
+        while stack:
+            prefix, d = stack.pop()
+            for k, v in d.items():
+                full = f"{prefix}.{k}" if prefix else k
+                if isinstance(v, dict):
+                    stack.append((full, v))
+                elif v:
+                    keys.add(full)
+    return keys
+
+
+def build_search_index(pl_data, en_data):
+    """
+    Flatten pl_data into rows of (full key, parent row, lowercased haystack).
+    Branch haystacks hold the key only; leaf haystacks also hold the PL and
+    EN texts, separated by NUL so a match never spans two fields. The parent
+    row index is -1 for top-level keys.
+    """
+    rows = []
+    stack = [("", pl_data, en_data, -1)]
+    while stack:
+        prefix, cur, en_cur, parent = stack.pop()
+        if not isinstance(en_cur, dict):
+            en_cur = {}
+        for key, val in cur.items():
+            full = f"{prefix}.{key}" if prefix else key
+            en_val = en_cur.get(key)
+            if isinstance(val, dict):
+                rows.append((full, parent, full.lower()))
+                stack.append((full, val, en_val, len(rows) - 1))
             else:
-                for subk, subv in nested.items():
-                    result[key][subk] = subv
+                if isinstance(en_val, dict) or not en_val:
+                    en_val = ""
+                hay = f"{full}\0{val}\0{en_val}".lower()
+                rows.append((full, parent, hay))
+    return rows
+
+
+def intern_leaves(d, max_len=64):
+    """
+    Intern keys and short string values in place, so the PL and EN trees share
+    one object per key and repeated texts are stored once. Longer repeated
+    values are deduplicated within d only, through a pool dropped on return.
+    Each dict is refilled in its original order.
+    """
+    intern = sys.intern
+    pool = {}
+    stack = [d]
+    while stack:
+        cur = stack.pop()
+        items = list(cur.items())
+        cur.clear()
+        for key, val in items:
+            if isinstance(val, dict):
+                stack.append(val)
+            elif isinstance(val, str):
+                val = intern(val) if len(val) < max_len else pool.setdefault(val, val)
+            cur[intern(key)] = val
+
+
+def join_haystacks(rows):
+    """
+    Join the haystacks of build_search_index rows into one newline-separated
+    string. Returns (blob, starts), where starts[i] is the offset of row i.
+    """
+    starts = []
+    offset = 0
+    for row in rows:
+        starts.append(offset)
+        offset += len(row[2]) + 1
+    return "\n".join(row[2] for row in rows), starts
+
+
+def find_rows(search, blob, starts):
+    """Return the indices of the rows in a join_haystacks blob containing search."""
+    hits = []
+    find = blob.find
+    last = len(starts) - 1
+    pos = find(search)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        hits.append(i)
+        if i == last:
+            break
+        pos = find(search, starts[i + 1])
+    return hits
+
+
+def get_nested_dict(d, keys):
+    """Return the dict stored under keys, or None if keys do not lead to a dict."""
+    cur = d
+    for k in keys:
+        if not isinstance(cur, dict):
+            return None
+        cur = cur.get(k)
+    return cur if isinstance(cur, dict) else None
+
+
+def flatten_to_nested(d: dict) -> dict:
+    root = {}
+    # Each frame: (remaining items, dict being built, its parent, key in parent)
+    stack = [(iter(d.items()), root, None, None)]
+    while stack:
+        items, result, parent, parent_key = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                stack.append((iter(value.items()), {}, result, key))
+                break
+            set_nested(result, key.split("."), value)
         else:
-            parts = key.split(".")
-            set_nested(result, parts, value)
-    return result
+            stack.pop()
+            if parent is None:
+                continue
+            existing = parent.get(parent_key)
+            if isinstance(existing, dict):
+                existing.update(result)
+            else:
+                parent[parent_key] = result
+    return root
 
 
 class TranslationApp(ThemedTk):
-    def __init__(self, pl_path, en_path, max_workers=5):
+    def __init__(self, pl_path, en_path, max_workers=RequestThrottle.max_concurrent):
         super().__init__(theme="equilux")
         config = load_json(CONFIG_PATH)
         self.menu_bar = tk.Menu(self)
@@ -346,10 +828,17 @@ class TranslationApp(ThemedTk):
         self._create_file_menu()
         self._create_help_menu()
         self._create_settings_menu()
+        self._title_text = None
         self.pl_path = pl_path
         self.en_path = en_path
         self._load_data()
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="deepl"
+        )
+        self._pending = []
+        self._flush_job = None
+        self._refresh_pending = None
+        self._search_job = None
         style = ThemedStyle(self)
         style.configure("Custom.Treeview")
         style.map(
@@ -370,10 +859,9 @@ class TranslationApp(ThemedTk):
         self.update_title()
         cfg_main_window_size = config.get("main_window_size")
         main_window_size = TypeUtils.is_null_or_empty(cfg_main_window_size, "600x400")
-        self.geometry(main_window_size)
-        self.center_window()
-        self.undo_stack = []
-        self.redo_stack = []
+        self.center_window(main_window_size)
+        self.undo_stack = deque(maxlen=_UNDO_LIMIT)
+        self.redo_stack = deque(maxlen=_UNDO_LIMIT)
         self.bind_all("<Command-z>", lambda e: self.undo_last())
         self.bind_all("<Command-y>", lambda e: self.redo_last())
         self.bind_all("<Control-z>", lambda e: self.undo_last())
@@ -391,13 +879,25 @@ class TranslationApp(ThemedTk):
         )
         self.search_entry.pack(side="left", fill="x", expand=True, padx=(5, 0))
 
+        # Packed before the tree so it keeps its row when the window shrinks
+        self.status_var = tk.StringVar(self)
+        ttk.Label(self, textvariable=self.status_var, anchor="w").pack(
+            side="bottom", fill="x", padx=5
+        )
+
         self.tree = ttk.Treeview(self, style="Custom.Treeview", selectmode="browse")
         self.tree["columns"] = ("full_key",)
         self.tree.column("full_key", width=0, stretch=False)
         self.tree.heading("#0", text="Translation Keys")
         self.tree.pack(fill="both", expand=True)
+        self._node_by_key = {"": ""}
+        self._leaf_rows = {}
+        self._placeholders = {}
+        self._children = {}
+        self._visible = None
 
         self.tree.bind("<Button-1>", self.on_tree_click)
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
 
         self.menu = tk.Menu(self, tearoff=0)
         self.menu.add_command(label="Copy Key", command=self.copy_key)
@@ -427,30 +927,34 @@ class TranslationApp(ThemedTk):
         self.executor.submit(refresh_usage_cache)
 
     def select_key(self, full_key: str):
-        def _find(item):
-            if self.tree.set(item, "full_key") == full_key:
-                return item
-            for child in self.tree.get_children(item):
-                found = _find(child)
-                if found:
-                    self.tree.item(item, open=True)
-                    return found
-            return None
-
-        target = None
-        for root in self.tree.get_children(""):
-            target = _find(root)
-            if target:
-                break
+        parts = full_key.split(".")
+        for depth in range(1, len(parts)):
+            prefix = ".".join(parts[:depth])
+            node = self._node_by_key.get(prefix)
+            if node is None:
+                return
+            if prefix in self._placeholders:
+                self._expand_lazy(node, prefix)
+            self.tree.item(node, open=True)
 
-        if target:
+        target = self._node_by_key.get(full_key)
+        if target and (self._visible is None or full_key in self._visible):
             self.tree.selection_set(target)
             self.tree.see(target)
             self.tree.focus(target)
 
     def key_exists(self, full_key: str) -> bool:
-        parts = full_key.split(".")
-        return bool(get_nested(self.pl_data, parts) or get_nested(self.en_data, parts))
+        if self._key_set is None:
+            self._key_set = collect_keys(self.pl_data, self.en_data)
+        return full_key in self._key_set
+
+    def known_translation(self, pl_text: str) -> str:
+        """Return an EN text already paired with pl_text in the files, or ""."""
+        if self._known_en is None:
+            self._known_en = {
+                pl: en for pl, en in iter_leaf_pairs(self.pl_data, self.en_data) if en
+            }
+        return self._known_en.get(pl_text, "")
 
     def reorganize_all(self):
         if not messagebox.askyesno(
@@ -461,6 +965,7 @@ class TranslationApp(ThemedTk):
 
         self.pl_data = flatten_to_nested(self.pl_data)
         self.en_data = flatten_to_nested(self.en_data)
+        self._data_changed()
 
         self.insert_all()
         self.update_title()
@@ -493,8 +998,7 @@ class TranslationApp(ThemedTk):
         cfg_size = config.get("config_window_size")
         config_window_size = TypeUtils.is_null_or_empty(cfg_size, "800x500")
         win.geometry(config_window_size)
-        style = ThemedStyle(win)
-        style.set_theme("equilux")
+        style = ttk.Style(win)
         bg = style.lookup("TFrame", "background")
         fg = style.lookup("TLabel", "foreground") or "white"
         win.configure(background=bg)
@@ -616,22 +1120,22 @@ class TranslationApp(ThemedTk):
         self.menu_bar.add_cascade(label="Help", menu=help_menu)
 
     def count_translations(self):
-        def _count_dict(d):
-            count = 0
-            for v in d.values():
-                if isinstance(v, dict):
-                    count += _count_dict(v)
-                else:
-                    count += 1
-            return count
-
-        return _count_dict(self.pl_data)
+        count = 0
+        stack = [self.pl_data]
+        while stack:
+            d = stack.pop()
+            branches = [v for v in d.values() if isinstance(v, dict)]
+            stack.extend(branches)
+            count += len(d) - len(branches)
+        return count
 
     def update_title(self):
-        count = self.count_translations()
-        self.title(
-            f"Language Files - {Path(self.pl_path).name} & {Path(self.en_path).name} | Translations: {count}"
-        )
+        if self._translation_count is None:
+            self._translation_count = self.count_translations()
+        title = f"Language Files - {Path(self.pl_path).name} & {Path(self.en_path).name} | Translations: {self._translation_count}"
+        if title != self._title_text:
+            self._title_text = title
+            self.title(title)
 
     @staticmethod
     def show_overview():
@@ -666,8 +1170,30 @@ class TranslationApp(ThemedTk):
         messagebox.showinfo("FAQ", text)
 
     def _load_data(self):
-        self.pl_data = load_json(self.pl_path)
-        self.en_data = load_json(self.en_path)
+        self.pl_data, self.en_data = load_json_files(self.pl_path, self.en_path)
+        intern_leaves(self.pl_data)
+        intern_leaves(self.en_data)
+        self._saved_state = {
+            path: (None, _file_signature(path)) for path in (self.pl_path, self.en_path)
+        }
+        self._data_changed()
+        self._dirty = False
+
+    def _data_changed(self):
+        """Drop lookup tables derived from pl_data/en_data after they change."""
+        self._search_rows = None
+        self._last_hits = None
+        self._key_set = None
+        self._known_en = None
+        self._dirty = True
+        self._translation_count = None
+
+    def _search_index(self):
+        """Return build_search_index rows for the current data, cached."""
+        if self._search_rows is None:
+            self._search_rows = build_search_index(self.pl_data, self.en_data)
+            self._search_blob = join_haystacks(self._search_rows)
+        return self._search_rows
 
     def on_tree_click(self, event):
         row = self.tree.identify_row(event.y)
@@ -717,10 +1243,17 @@ class TranslationApp(ThemedTk):
             self.clipboard_clear()
             self.clipboard_append(val)
 
-    def center_window(self):
-        self.update_idletasks()
-        w = self.winfo_width()
-        h = self.winfo_height()
+    def center_window(self, size=None):
+        match = re.fullmatch(r"(\d+)x(\d+)", size or "")
+        if match:
+            # Size is already known; no need to flush geometry first
+            w, h = map(int, match.groups())
+        else:
+            if size:
+                self.geometry(size)
+            self.update_idletasks()
+            w = self.winfo_width()
+            h = self.winfo_height()
         sw = self.winfo_screenwidth()
         sh = self.winfo_screenheight()
         x = (sw - w) // 2
@@ -728,74 +1261,284 @@ class TranslationApp(ThemedTk):
         self.geometry(f"{w}x{h}+{x}+{y}")
 
     def on_close(self):
-        self.executor.shutdown(wait=True)  # Ensure all tasks complete before shutdown
+        for job in (self._flush_job, self._refresh_pending, self._search_job):
+            if job is not None:
+                self.after_cancel(job)
+        try:
+            # Drop queued translations instead of blocking the window on DeepL
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:  # Python < 3.9
+            self.executor.shutdown(wait=False)
+        TranslationCache.save()
         self.destroy()
         self.quit()
 
-    def get_expanded_keys(self):
-        expanded = set()
-        for item in self.tree.get_children(""):
-            self._collect_expanded(item, expanded)
-        return expanded
-
-    def _collect_expanded(self, item, expanded):
-        if self.tree.item(item, "open"):
-            key = self.tree.set(item, "full_key")
-            if key:
-                expanded.add(key)
-        for child in self.tree.get_children(item):
-            self._collect_expanded(child, expanded)
-
-    def restore_expanded_keys(self, expanded):
-        def _restore(value):
-            key = self.tree.set(value, "full_key")
-            if key in expanded:
-                self.tree.item(value, open=True)
-            for child in self.tree.get_children(value):
-                _restore(child)
-
-        for item in self.tree.get_children(""):
-            _restore(item)
+    def _open_branches(self):
+        """Return the full keys of the expanded branches."""
+        item = self.tree.item
+        node_by_key = self._node_by_key
+        return {
+            full for full in self._children if full and item(node_by_key[full], "open")
+        }
 
     def on_search(self, *args):
-        self.insert_all()
+        # Restart the timer on every keystroke so a burst of typing
+        # filters the tree once, after the user pauses.
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(150, self._apply_search)
+
+    def _apply_search(self):
+        """
+        Show only the rows matching the current search. Rows already in the
+        tree are detached or reattached in place instead of being rebuilt.
+        """
+        self._search_job = None
+        search = self.search_var.get().strip().lower()
+        visible = self._collect_visible(search) if search else None
+        if visible is None and self._visible is None:
+            return
+        self._visible = visible
+        set_children = self.tree.set_children
+        for prefix, kids in self._children.items():
+            set_children(
+                self._node_by_key[prefix],
+                *[iid for full, iid in kids if visible is None or full in visible],
+            )
 
     def insert_all(self):
+        for job in (self._refresh_pending, self._search_job):
+            if job is not None:
+                self.after_cancel(job)
+        self._refresh_pending = self._search_job = None
         search = self.search_var.get().strip().lower()
-        expanded = self.get_expanded_keys()
+        expanded = self._open_branches()
+        if self._visible is not None:
+            # Rows hidden by the last search are detached and unreachable from
+            # the root; reattach them so the delete below frees them too.
+            for prefix, kids in self._children.items():
+                self.tree.set_children(
+                    self._node_by_key[prefix], *(node for _, node in kids)
+                )
         self.tree.delete(*self.tree.get_children())
-
-        def add_nodes(parent, data, prefix=""):
+        self._node_by_key = {"": ""}
+        self._leaf_rows = {}
+        self._placeholders = {}
+        self._children = {}
+        self._visible = self._collect_visible(search) if search else None
+        self._populate("", "", self.pl_data, self.en_data, expanded)
+
+    def _collect_visible(self, search):
+        """Return the full keys that stay in the tree while filtering by search."""
+        rows = self._search_index()
+        # Typing more characters can only narrow the matches, so start from
+        # the previous hits when the old query is part of the new one.
+        last = self._last_hits
+        if last is not None and last[0] in search:
+            hits = [i for i in last[1] if search in rows[i][2]]
+        elif "\n" not in search and self._search_blob[0].count(search) * 8 < len(rows):
+            # Selective query: let str.find skip over the non-matching rows
+            hits = find_rows(search, *self._search_blob)
+        else:
+            hits = [i for i, row in enumerate(rows) if search in row[2]]
+        self._last_hits = (search, hits)
+
+        visible = set()
+        for i in hits:
+            full, parent, _ = rows[i]
+            if full in visible:
+                continue
+            visible.add(full)
+            # Keep every ancestor so the match stays reachable
+            while parent >= 0:
+                full, parent, _ = rows[parent]
+                if full in visible:
+                    break
+                visible.add(full)
+        return visible
+
+    def _populate(self, parent, prefix, data, en_data, expanded=()):
+        """Insert the children of data under parent, expanding the keys in expanded."""
+        insert = self._raw_insert()
+        node_by_key = self._node_by_key
+        visible = self._visible
+        stack = [(parent, prefix, data, en_data)]
+        while stack:
+            parent, prefix, data, en_data = stack.pop()
+            if not isinstance(en_data, dict):
+                en_data = {}
+            kids = self._children[prefix] = []
+            hidden = []
             for key, val in sorted(data.items()):
                 full = f"{prefix}.{key}" if prefix else key
-                en_val = get_nested(self.en_data, full.split(".")) or ""
-                pl_val = val if not isinstance(val, dict) else ""
-                node_matches = (
-                    search in full.lower()
-                    or search in pl_val.lower()
-                    or search in en_val.lower()
-                    or not search
+                en_val = en_data.get(key)
+                is_branch = isinstance(val, dict)
+                is_open = is_branch and bool(val) and full in expanded
+                node = insert(
+                    parent, "end", "-text", key, "-values", (full,), "-open", is_open
                 )
-                if isinstance(val, dict):
-                    for _, _ in val.items():
-                        pass
-                    node_id = self.tree.insert(
-                        parent, "end", text=key, values=(full,), open=(full in expanded)
+                if is_branch:
+                    node_by_key[full] = node
+                    if is_open:
+                        stack.append((node, full, val, en_val))
+                    elif val:
+                        self._add_placeholder(node, full)
+                else:
+                    if isinstance(en_val, dict):
+                        en_val = None
+                    self._insert_leaf_rows(node, full, val, en_val or "", insert)
+                kids.append((full, node))
+                if visible is not None and full not in visible:
+                    hidden.append(node)
+            if hidden:
+                self.tree.detach(*hidden)
+
+    def _raw_insert(self):
+        """Return the Tcl insert command of the tree, bypassing Treeview.insert."""
+        return functools.partial(self.tree.tk.call, str(self.tree), "insert")
+
+    def _add_placeholder(self, node, full):
+        self._placeholders[full] = self.tree.insert(
+            node, "end", text="…", tags=("placeholder",)
+        )
+
+    def _on_open(self, event=None):
+        node = self.tree.focus()
+        if node:
+            self._expand_lazy(node, self.tree.set(node, "full_key"))
+
+    def _expand_lazy(self, node, full):
+        placeholder = self._placeholders.pop(full, None)
+        if placeholder is None:
+            return
+        self.tree.delete(placeholder)
+        parts = full.split(".")
+        data = get_nested_dict(self.pl_data, parts)
+        if data:
+            self._populate(node, full, data, get_nested_dict(self.en_data, parts))
+
+    def _insert_leaf_rows(self, node, full, pl_val, en_val, insert=None):
+        if insert is None:
+            insert = self._raw_insert()
+        self._node_by_key[full] = node
+        self._leaf_rows[full] = (
+            insert(node, "end", "-text", f"[PL] {pl_val}"),
+            insert(node, "end", "-text", f"[EN] {en_val}" if en_val else _NO_EN_LABEL),
+        )
+
+    def _insert_path(self, parts):
+        """
+        Insert or refresh the rows of a single key without rebuilding the tree.
+        Only the missing ancestors and the leaf rows are touched, so the cost
+        depends on the key depth rather than on the file size.
+        Returns:
+            bool: False when the tree cannot be patched in place (active search,
+            key missing from the PL data, or a leaf that turned into a branch);
+            the caller should then fall back to insert_all.
+        """
+        if self._visible is not None or self.search_var.get().strip():
+            return False
+        parent = ""
+        prefix = ""
+        data = self.pl_data
+        for depth, key in enumerate(parts):
+            if not isinstance(data, dict) or key not in data:
+                return False
+            full = ".".join(parts[: depth + 1])
+            val = data[key]
+            is_branch = isinstance(val, dict)
+            is_last = depth == len(parts) - 1
+            node = self._node_by_key.get(full)
+            if node is None:
+                # Siblings are kept sorted, so the slot is a binary search away
+                kids = self._children.setdefault(prefix, [])
+                index = bisect.bisect_left(kids, (full,))
+                node = self.tree.insert(parent, index, text=key, values=(full,))
+                self._node_by_key[full] = node
+                kids.insert(index, (full, node))
+                if is_branch:
+                    # The rest of the path is filled in lazily by _on_open.
+                    if val:
+                        self._add_placeholder(node, full)
+                    return True
+            elif is_branch == (full in self._leaf_rows):
+                return False
+            elif is_branch and full in self._placeholders:
+                return True
+            if not is_branch:
+                if not is_last:
+                    return False
+                en_val = get_nested(self.en_data, parts)
+                rows = self._leaf_rows.get(full)
+                if rows:
+                    self.tree.item(rows[0], text=f"[PL] {val}")
+                    self.tree.item(
+                        rows[1], text=f"[EN] {en_val}" if en_val else _NO_EN_LABEL
                     )
-                    add_nodes(node_id, val, full)
-                    if not self.tree.get_children(node_id) and not node_matches:
-                        self.tree.delete(node_id)
                 else:
-                    if node_matches:
-                        node = self.tree.insert(
-                            parent, "end", text=key, values=(full,), open=False
-                        )
-                        self.tree.insert(node, "end", text=f"[PL] {pl_val}")
-                        display_en = en_val or "(no translation)"
-                        self.tree.insert(node, "end", text=f"[EN] {display_en}")
+                    self._insert_leaf_rows(node, full, val, en_val)
+                return True
+            parent = node
+            prefix = full
+            data = val
+        return True
+
+    def _refresh_key(self, parts):
+        if self._refresh_pending is None and self._insert_path(parts):
+            return
+        self._schedule_refresh()
 
-        add_nodes("", self.pl_data)
-        self.restore_expanded_keys(expanded)
+    def _remove_path(self, parts):
+        """
+        Delete the rows of a key that was removed from the data, together with
+        any ancestors that were pruned with it, without rebuilding the tree.
+        Returns:
+            bool: False when the tree cannot be patched in place (active
+            search); the caller should then fall back to insert_all.
+        """
+        if self._visible is not None or self.search_var.get().strip():
+            return False
+        data = self.pl_data
+        for depth, key in enumerate(parts):
+            if not isinstance(data, dict) or key not in data:
+                break
+            data = data[key]
+        else:
+            # Still present, nothing to remove
+            return True
+        prefix = ".".join(parts[:depth])
+        full = f"{prefix}.{key}" if prefix else key
+        node = self._node_by_key.get(full)
+        if node is None:
+            # Never inserted: it sat under a branch that was not expanded yet
+            return True
+        self.tree.delete(node)
+        kids = self._children.get(prefix, [])
+        index = bisect.bisect_left(kids, (full,))
+        if index < len(kids) and kids[index][0] == full:
+            del kids[index]
+        stack = [full]
+        while stack:
+            gone = stack.pop()
+            self._node_by_key.pop(gone, None)
+            self._leaf_rows.pop(gone, None)
+            self._placeholders.pop(gone, None)
+            stack.extend(f for f, _ in self._children.pop(gone, ()))
+        return True
+
+    def _drop_key(self, parts):
+        if self._refresh_pending is None and self._remove_path(parts):
+            return
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Rebuild the tree once after a burst of changes instead of after each."""
+        if self._refresh_pending is None:
+            self._refresh_pending = self.after(150, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = None
+        self.insert_all()
 
     def add_new(self):
         self.redo_stack.clear()
@@ -815,14 +1558,16 @@ class TranslationApp(ThemedTk):
 
         parts = dlg.result["key"].split(".")
         pl_text = dlg.result["pl"]
+        known_en = self.known_translation(pl_text) if dlg.result["auto"] else ""
 
-        op = {"action": ActionEnum.Add.value, "parts": parts, "pl": pl_text, "en": ""}
+        op = AddOp(parts, pl_text)
         self.undo_stack.append(op)
         set_nested(self.pl_data, parts, pl_text)
+        self._data_changed()
 
-        if dlg.result["auto"]:
+        if dlg.result["auto"] and not known_en:
             needed = estimate_char_cost(pl_text)
-            remaining, used, limit = get_remaining_quota(translator)
+            remaining, used, limit = get_remaining_quota()
             if remaining is not None and remaining < needed:
                 messagebox.showerror(
                     "DeepL limit",
@@ -830,15 +1575,16 @@ class TranslationApp(ThemedTk):
                     f"Needed: {needed} characters\n"
                     f"Remaining: {remaining} / {limit} (used {used})",
                 )
-                self.insert_all()
+                self._refresh_key(parts)
                 self.update_title()
                 return
-            self.executor.submit(self.translate_and_insert, parts, pl_text)
+            self._queue_translation(parts, pl_text, op)
         else:
-            manual_en = dlg.result.get("en", "").strip()
-            op["en"] = manual_en
+            manual_en = known_en or dlg.result.get("en", "").strip()
+            op.en = manual_en
             set_nested(self.en_data, parts, manual_en)
-            self.insert_all()
+            self._data_changed()
+            self._refresh_key(parts)
             self.update_title()
 
     def _get_selected_full_key(self):
@@ -887,15 +1633,13 @@ class TranslationApp(ThemedTk):
 
         new_key = dlg.result["key"]
         new_parts = new_key.split(".")
-        op = {
-            "action": ActionEnum.Edit.value,
-            "old_parts": parts,
-            "new_parts": new_parts,
-            "old_pl": old_pl,
-            "old_en": old_en,
-            "new_pl": dlg.result["pl"],
-            "new_en": "",
-        }
+        op = EditOp(
+            old_parts=parts,
+            new_parts=new_parts,
+            old_pl=old_pl,
+            old_en=old_en,
+            new_pl=dlg.result["pl"],
+        )
         self.undo_stack.append(op)
         # If key changed, move subtree
         if new_parts != parts:
@@ -903,18 +1647,17 @@ class TranslationApp(ThemedTk):
             pl_val = get_nested(self.pl_data, parts)
             en_val = get_nested(self.en_data, parts)
             # remove old
-            self.remove_nested(self.pl_data, parts)
-            self.remove_nested(self.en_data, parts)
+            self.remove_nested_pair(self.pl_data, self.en_data, parts)
             parts = new_parts
             # set new subtree
-            set_nested(self.pl_data, parts, pl_val)
-            set_nested(self.en_data, parts, en_val)
+            set_nested_pair(self.pl_data, self.en_data, parts, pl_val, en_val)
 
         # Update texts
         set_nested(self.pl_data, parts, dlg.result["pl"])
+        self._data_changed()
         if dlg.result["auto"]:
             needed = estimate_char_cost(dlg.result["pl"])
-            remaining, used, limit = get_remaining_quota(translator)
+            remaining, used, limit = get_remaining_quota()
             if remaining is not None and remaining < needed:
                 messagebox.showerror(
                     "DeepL limit",
@@ -924,47 +1667,87 @@ class TranslationApp(ThemedTk):
                 )
                 self.insert_all()
                 return
-            self.executor.submit(self.translate_and_insert, parts, dlg.result["pl"])
+            self._queue_translation(parts, dlg.result["pl"], op)
+            if new_key != full:
+                # Finished translations only patch the new key; drop the old row now.
+                self.insert_all()
         else:
             manual_en = dlg.result.get("en", "").strip()
-            op["new_en"] = manual_en
+            op.new_en = manual_en
             set_nested(self.en_data, parts, dlg.result.get("en", ""))
+            self._data_changed()
             self.insert_all()
 
-    def translate_and_insert(self, parts, pl_text):
-        en_text = translate_text(pl_text)
-        self.after(0, lambda: self.finish_insert(parts, en_text))
+    def _queue_translation(self, parts, pl_text, op):
+        """
+        Queue a key for DeepL; keys queued within 200 ms share one request.
+        op is the undo entry that receives the translation once it arrives.
+        """
+        self._pending.append((parts, pl_text, op))
+        if len(self._pending) >= _BATCH_SIZE:
+            if self._flush_job is not None:
+                self.after_cancel(self._flush_job)
+            self._flush_pending()
+        elif self._flush_job is None:
+            self._flush_job = self.after(200, self._flush_pending)
+
+    def _flush_pending(self):
+        self._flush_job = None
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), _BATCH_SIZE):
+            batch = pending[start : start + _BATCH_SIZE]
+            future = self.executor.submit(
+                translate_texts, [pl_text for _, pl_text, _ in batch]
+            )
+            future.add_done_callback(lambda f, b=batch: self._batch_done(b, f))
 
-    def finish_insert(self, parts, en_text):
-        if not en_text:
+    def _batch_done(self, batch, future):
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logging.error(f"Batch translation failed: {future.exception()}")
+            results = [""] * len(batch)
+        else:
+            results = future.result()
+        items = [
+            (parts, en_text, op) for (parts, _, op), en_text in zip(batch, results)
+        ]
+        try:
+            self.after(0, lambda: self._finish_translations(items))
+        except (RuntimeError, tk.TclError):
+            pass  # window already closed
+
+    def _finish_translations(self, items):
+        done = [item for item in items if item[1]]
+        if len(done) < len(items):
             messagebox.showerror(
                 "Translation failed",
                 "Error while translating text. Check connection with DeepL and try again",
             )
+        if not done:
             return
-        set_nested(self.en_data, parts, en_text)
-
-        for op in reversed(self.undo_stack):
-            if op["parts"] == parts or (
-                op["action"] == ActionEnum.Edit.value
-                and parts in (op.get("old_parts"), op.get("new_parts"))
-            ):
-                if op["action"] == ActionEnum.Add.value:
-                    op["en"] = en_text
-                elif op["action"] == ActionEnum.Edit.value:
-                    op["new_en"] = en_text
-                break
+
+        for parts, en_text, op in done:
+            set_nested(self.en_data, parts, en_text)
+            self._data_changed()
+
+            # Record the result on the undo entry that requested it
+            if op is not None and op.action == ActionEnum.Add.value:
+                op.en = en_text
+            elif op is not None and op.action == ActionEnum.Edit.value:
+                op.new_en = en_text
 
         self._refresh_global_usage()
 
         remaining, used, limit = DeepLUsageCache.value
         if remaining is not None:
-            messagebox.showinfo(
+            notify(
                 "DeepL usage",
                 f"Translation completed.\nRemaining limit: {remaining} / {limit} (used {used}).",
             )
 
-        self.insert_all()
+        for parts, _, _ in done:
+            self._refresh_key(parts)
 
     def change_files(self):
         new_pl = filedialog.askopenfilename(
@@ -989,31 +1772,71 @@ class TranslationApp(ThemedTk):
 
         self.pl_path, self.en_path = new_pl, new_en
         self._load_data()
-        self.title(
-            f"Language Files - {Path(self.pl_path).name} & {Path(self.en_path).name}"
-        )
-        self.insert_all()
+        self.update_title()
+        self._schedule_refresh()
 
     def save(self):
-        save_json(self.pl_data, self.pl_path)
-        save_json(self.en_data, self.en_path)
-        messagebox.showinfo("Saved", f"Updated:\n{self.pl_path}\n{self.en_path}")
+        paths = (self.pl_path, self.en_path)
+        datas = (self.pl_data, self.en_data)
+        if os.path.realpath(paths[0]) == os.path.realpath(paths[1]):
+            # Both files point at one target; concurrent writes would race
+            changed = list(map(self._save_if_changed, datas, paths))
+        else:
+            with concurrent.futures.ThreadPoolExecutor(len(paths)) as pool:
+                changed = list(pool.map(self._save_if_changed, datas, paths))
+        self._dirty = False
+        written = [path for path, flag in zip(paths, changed) if flag]
+        if written:
+            notify("Saved", "Updated:\n" + "\n".join(written))
+        else:
+            notify("Saved", "No changes to save.")
+
+    def _save_if_changed(self, data, path):
+        """
+        Write data to path unless it matches what was last loaded or saved there.
+        The file is still written when it changed on disk in the meantime.
+        """
+        saved, signature = self._saved_state.get(path, (None, None))
+        on_disk = signature is not None and _file_signature(path) == signature
+        if on_disk and not self._dirty:
+            return False
+        raw = _dumps(data)
+        digest = _digest(raw)
+        if on_disk and saved is None:
+            # Not saved since loading; compare with the file as it was loaded
+            with contextlib.suppress(OSError, ValueError):
+                if _loads(Path(path).read_bytes()) == data:
+                    saved = digest
+        if on_disk and saved == digest:
+            self._saved_state[path] = (digest, signature)
+            return False
+        _write_bytes(raw, path)
+        self._saved_state[path] = (digest, _file_signature(path))
+        return True
 
     @staticmethod
-    def remove_nested(d, keys):
+    def remove_nested_pair(pl, en, keys):
+        """
+        Remove keys from the PL and EN trees in a single walk, then drop the
+        branches the removal left empty. A tree whose path is broken is skipped.
+        """
         if not keys:
             return
-        cur = d
-        parents = []
+        pl_trail, en_trail = [], []
         for k in keys[:-1]:
-            parents.append((cur, k))
-            cur = cur.get(k, {})
-            if not isinstance(cur, dict):
-                return
-        cur.pop(keys[-1], None)
-        for parent, key in reversed(parents):
-            if parent[key] == {}:
-                parent.pop(key)
+            pl_trail.append(pl)
+            en_trail.append(en)
+            pl = pl.get(k) if isinstance(pl, dict) else None
+            en = en.get(k) if isinstance(en, dict) else None
+        for leaf, trail in ((pl, pl_trail), (en, en_trail)):
+            if not isinstance(leaf, dict):
+                continue
+            leaf.pop(keys[-1], None)
+            # Once a parent still has children, none of its ancestors can be empty
+            for parent, key in zip(reversed(trail), reversed(keys[:-1])):
+                if parent[key]:
+                    break
+                del parent[key]
 
     def delete_selected(self):
         self.redo_stack.clear()
@@ -1029,62 +1852,74 @@ class TranslationApp(ThemedTk):
         parts = full.split(".")
         old_pl = get_nested(self.pl_data, parts)
         old_en = get_nested(self.en_data, parts)
-        self.undo_stack.append(
-            {"action": "delete", "parts": parts, "old_pl": old_pl, "old_en": old_en}
-        )
-        self.remove_nested(self.pl_data, parts)
-        self.remove_nested(self.en_data, parts)
+        self.undo_stack.append(DeleteOp(parts, old_pl, old_en))
+        self.remove_nested_pair(self.pl_data, self.en_data, parts)
+        self._data_changed()
         self.insert_all()
         self.update_title()
 
     def undo_last(self):
         if not self.undo_stack:
-            messagebox.showinfo("Undo", "Nothing to undo.")
+            self.status_var.set("Nothing to undo.")
             return
         op = self.undo_stack.pop()
         self.redo_stack.append(op)
-        action = op["action"]
+        action = op.action
         if action == ActionEnum.Add.value:
-            self.remove_nested(self.pl_data, op["parts"])
-            self.remove_nested(self.en_data, op["parts"])
-            messagebox.showinfo("Undo", "Undo add operation.")
+            self.remove_nested_pair(self.pl_data, self.en_data, op.parts)
+            self._data_changed()
+            self._drop_key(op.parts)
+            self.status_var.set("Undo add operation.")
         elif action == ActionEnum.Delete.value:
-            set_nested(self.pl_data, op["parts"], op["old_pl"])
-            set_nested(self.en_data, op["parts"], op["old_en"])
-            messagebox.showinfo("Undo", "Undo delete operation.")
+            set_nested_pair(self.pl_data, self.en_data, op.parts, op.old_pl, op.old_en)
+            self._data_changed()
+            self._refresh_key(op.parts)
+            self.status_var.set("Undo delete operation.")
         elif action == ActionEnum.Edit.value:
-            self.remove_nested(self.pl_data, op["new_parts"])
-            self.remove_nested(self.en_data, op["new_parts"])
-            set_nested(self.pl_data, op["old_parts"], op["old_pl"])
-            set_nested(self.en_data, op["old_parts"], op["old_en"])
-            messagebox.showinfo("Undo", "Undo edit operation.")
-        self.insert_all()
+            self.remove_nested_pair(self.pl_data, self.en_data, op.new_parts)
+            set_nested_pair(
+                self.pl_data, self.en_data, op.old_parts, op.old_pl, op.old_en
+            )
+            self._data_changed()
+            self._drop_key(op.new_parts)
+            self._refresh_key(op.old_parts)
+            self.status_var.set("Undo edit operation.")
         self.update_title()
 
     def redo_last(self):
         if not self.redo_stack:
-            messagebox.showinfo("Redo", "Nothing to redo.")
+            self.status_var.set("Nothing to redo.")
             return
         op = self.redo_stack.pop()
         self.undo_stack.append(op)
-        action = op["action"]
+        action = op.action
 
         if action == ActionEnum.Add.value:
-            set_nested(self.pl_data, op["parts"], op.get("pl") or "")
-            set_nested(self.en_data, op["parts"], op.get("en") or "")
-            messagebox.showinfo("Redo", "Redo add operation.")
+            set_nested_pair(
+                self.pl_data,
+                self.en_data,
+                op.parts,
+                op.pl or "",
+                op.en or "",
+            )
+            self._data_changed()
+            self._refresh_key(op.parts)
+            self.status_var.set("Redo add operation.")
         elif action == ActionEnum.Delete.value:
-            self.remove_nested(self.pl_data, op["parts"])
-            self.remove_nested(self.en_data, op["parts"])
-            messagebox.showinfo("Redo", "Redo delete operation.")
+            self.remove_nested_pair(self.pl_data, self.en_data, op.parts)
+            self._data_changed()
+            self._drop_key(op.parts)
+            self.status_var.set("Redo delete operation.")
         elif action == ActionEnum.Edit.value:
-            self.remove_nested(self.pl_data, op["old_parts"])
-            self.remove_nested(self.en_data, op["old_parts"])
-            set_nested(self.pl_data, op["new_parts"], op["new_pl"])
-            set_nested(self.en_data, op["new_parts"], op["new_en"])
-            messagebox.showinfo("Redo", "Redo edit operation.")
+            self.remove_nested_pair(self.pl_data, self.en_data, op.old_parts)
+            set_nested_pair(
+                self.pl_data, self.en_data, op.new_parts, op.new_pl, op.new_en
+            )
+            self._data_changed()
+            self._drop_key(op.old_parts)
+            self._refresh_key(op.new_parts)
+            self.status_var.set("Redo edit operation.")
 
-        self.insert_all()
         self.update_title()
 
 
@@ -41,6 +41,74 @@ def test_save_json_and_load(tmp_path):
     assert loaded == data
 
 
+def test_save_json_format_matches_stdlib(tmp_path):
+    out = tmp_path / "out.json"
+    data = {"a": {"b": "zażółć gęślą jaźń"}, "c": {}}
+    app.save_json(data, out)
+    expected = json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+    assert out.read_text(encoding="utf-8") == expected
+
+
+def test_save_json_replaces_file_atomically(tmp_path):
+    out = tmp_path / "out.json"
+    out.write_text("{}", encoding="utf-8")
+    out.chmod(0o600)
+    app.save_json({"a": "b"}, out)
+    assert json.loads(out.read_text(encoding="utf-8")) == {"a": "b"}
+    assert out.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_save_json_keeps_unrelated_tmp_file(tmp_path):
+    out = tmp_path / "out.json"
+    mine = tmp_path / "out.json.tmp"
+    mine.write_text("keep me", encoding="utf-8")
+    app.save_json({"a": "b"}, out)
+    assert mine.read_text(encoding="utf-8") == "keep me"
+    assert out.stat().st_mode & 0o777 == 0o644
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.json", "out.json.tmp"]
+
+
+def test_load_json_after_save_skips_disk_read(tmp_path, monkeypatch):
+    out = tmp_path / "out.json"
+    app.save_json({"a": {"b": "c"}}, out)
+    monkeypatch.setattr(
+        app.Path, "read_bytes", lambda self: pytest.fail("file was read again")
+    )
+    first = app.load_json(out)
+    assert first == {"a": {"b": "c"}}
+    first["a"]["b"] = "changed"
+    assert app.load_json(out) == {"a": {"b": "c"}}
+
+
+def test_save_json_failure_keeps_original(tmp_path, monkeypatch):
+    out = tmp_path / "out.json"
+    out.write_text('{"a": "b"}', encoding="utf-8")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(app.os, "replace", fail)
+    with pytest.raises(OSError):
+        app.save_json({"a": "c"}, out)
+    assert json.loads(out.read_text(encoding="utf-8")) == {"a": "b"}
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_load_json_cached_copy_is_independent(temp_json_file):
+    path, data = temp_json_file
+    first = app.load_json(path)
+    first["a"]["b"] = "changed"
+    assert app.load_json(path) == data
+
+
+def test_load_json_sees_saved_changes(temp_json_file):
+    path, _ = temp_json_file
+    app.load_json(path)
+    app.save_json({"new": "data"}, path)
+    assert app.load_json(path) == {"new": "data"}
+
+
 # -----------------------------
 # Nested dict helpers
 # -----------------------------
@@ -64,6 +132,111 @@ def test_get_nested_dict_case():
     assert app.get_nested(d, ["a", "b"]) == ""
 
 
+def test_intern_leaves_shares_short_strings():
+    a = {"x": "".join(["O", "K"]), "y": {"z": "".join(["O", "K"])}}
+    app.intern_leaves(a)
+    assert a["x"] is a["y"]["z"]
+    long_text = "x" * 100
+    b = {"p": long_text, "q": {"r": "".join(["x"] * 100)}}
+    app.intern_leaves(b)
+    assert b["p"] is b["q"]["r"]
+
+
+def test_intern_leaves_shares_keys_across_trees():
+    pl = app._loads(b'{"menu": {"title": "Tytul", "open": "Otworz"}}')
+    en = app._loads(b'{"menu": {"title": "Title", "open": "Open"}}')
+    app.intern_leaves(pl)
+    app.intern_leaves(en)
+    assert list(pl["menu"]) == ["title", "open"]
+    assert [id(k) for k in pl["menu"]] == [id(k) for k in en["menu"]]
+
+
+def test_flatten_to_nested_handles_deep_trees():
+    assert app.flatten_to_nested({"a.b": "x", "a": {"c.d": "y"}}) == {
+        "a": {"b": "x", "c": {"d": "y"}}
+    }
+    deep = leaf = {}
+    for _ in range(5000):
+        leaf["k"] = {}
+        leaf = leaf["k"]
+    leaf["x.y"] = "v"
+    node = app.flatten_to_nested(deep)
+    for _ in range(5000):
+        node = node["k"]
+    assert node == {"x": {"y": "v"}}
+
+
+def test_undo_ops_default_unused_fields_to_none():
+    op = app.AddOp(["a"], "x")
+    assert (op.action, op.parts, op.pl, op.en) == ("add", ["a"], "x", "")
+    assert op.old_parts is None and op.new_en is None
+    edit = app.EditOp(["a"], ["b"], "x", "y", "z")
+    assert (edit.action, edit.new_en, edit.parts) == ("edit", "", None)
+    with pytest.raises(AttributeError):
+        op.bogus = 1
+
+
+def test_notify_respects_quiet(monkeypatch):
+    shown = []
+    monkeypatch.setattr(app.messagebox, "showinfo", lambda *a: shown.append(a))
+    monkeypatch.setattr(app, "QUIET", True)
+    app.notify("Saved", "x")
+    assert shown == []
+    monkeypatch.setattr(app, "QUIET", False)
+    app.notify("Saved", "x")
+    assert shown == [("Saved", "x")]
+
+
+def test_nested_pair_helpers():
+    pl, en = {"a": {"b": "x", "c": "y"}}, {"a": "flat"}
+    app.set_nested_pair(pl, en, ["a", "d"], "p", "e")
+    assert pl == {"a": {"b": "x", "c": "y", "d": "p"}}
+    assert en == {"a": {"d": "e"}}
+    app.TranslationApp.remove_nested_pair(pl, en, ["a", "d"])
+    assert pl == {"a": {"b": "x", "c": "y"}}
+    assert en == {}
+    app.TranslationApp.remove_nested_pair(pl, {"a": "flat"}, ["a", "b", "z"])
+    assert pl == {"a": {"b": "x", "c": "y"}}
+
+
+def test_collect_keys():
+    pl = {"a": {"b": "x", "c": ""}, "e": {}}
+    en = {"a": {"c": "y"}, "d": "z"}
+    assert app.collect_keys(pl, en) == {"a.b", "a.c", "d"}
+
+
+def test_key_exists_ignores_branches():
+    ta = app.TranslationApp.__new__(app.TranslationApp)
+    ta.pl_data = {"menu": {"open": "Otworz"}}
+    ta.en_data = {"menu": {"open": "Open"}}
+    ta._data_changed()
+    assert ta.key_exists("menu.open")
+    assert not ta.key_exists("menu")
+    assert not ta.key_exists("menu.close")
+
+
+def test_build_search_index():
+    pl = {"a": {"b": "Kot", "c": {"d": "Pies"}}, "e": "z"}
+    en = {"a": {"b": "Cat"}}
+    rows = app.build_search_index(pl, en)
+    by_key = {
+        full: (rows[parent][0] if parent >= 0 else None, hay)
+        for full, parent, hay in rows
+    }
+    assert by_key["a"] == (None, "a")
+    assert by_key["a.b"] == ("a", "a.b\0kot\0cat")
+    assert by_key["a.c.d"] == ("a.c", "a.c.d\0pies\0")
+
+
+def test_find_rows_matches_per_row_scan():
+    pl = {"a": {"b": "Kot", "c": {"d": "Pies"}}, "e": "kotek", "f": "x\ny"}
+    rows = app.build_search_index(pl, {"a": {"b": "Cat"}})
+    blob, starts = app.join_haystacks(rows)
+    for search in ["kot", "a", "ies", "cat", "x", "nope", "\0"]:
+        expected = [i for i, row in enumerate(rows) if search in row[2]]
+        assert app.find_rows(search, blob, starts) == expected
+
+
 # -----------------------------
 # Translation tests
 # -----------------------------
@@ -83,6 +256,13 @@ def patch_translator(monkeypatch):
     monkeypatch.setattr(app, "translator", DummyTranslator())
 
 
+@pytest.fixture(autouse=True)
+def isolate_translation_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "CACHE_PATH", tmp_path / "cache.json")
+    monkeypatch.setattr(app.TranslationCache, "entries", None)
+    monkeypatch.setattr(app.TranslationCache, "dirty", False)
+
+
 def test_translate_text_success():
     assert (
         app.translate_text("hello", source_lang="PL", target_lang="EN-GB")
@@ -94,6 +274,113 @@ def test_translate_text_failure():
     assert app.translate_text("error") == ""
 
 
+def test_translate_text_without_api_key(monkeypatch):
+    monkeypatch.setattr(app, "translator", None)
+    monkeypatch.setattr(app, "load_dotenv", lambda: None)
+    monkeypatch.delenv("DEEPL_API_KEY", raising=False)
+    assert app.translate_text("hello") == ""
+    assert app.translator is None
+
+
+class DummyBatchTranslator:
+    def __init__(self):
+        self.calls = []
+
+    def translate_text(self, texts, source_lang=None, target_lang=None):
+        self.calls.append(list(texts))
+        if "error" in texts:
+            raise app.deepl.DeepLException("fail")
+        return [SimpleNamespace(text=t + "_translated") for t in texts]
+
+
+def test_translate_texts_single_request(monkeypatch):
+    dummy = DummyBatchTranslator()
+    monkeypatch.setattr(app, "translator", dummy)
+    assert app.translate_texts(["a", "b"]) == ["a_translated", "b_translated"]
+    assert dummy.calls == [["a", "b"]]
+
+
+def test_translate_texts_splits_large_batches(monkeypatch):
+    dummy = DummyBatchTranslator()
+    monkeypatch.setattr(app, "translator", dummy)
+    texts = ["%05d" % i for i in range(60)]
+    assert app.translate_texts(texts) == [t + "_translated" for t in texts]
+    assert [len(call) for call in dummy.calls] == [50, 10]
+
+    dummy.calls.clear()
+    monkeypatch.setattr(app, "_BATCH_BYTES", 100)
+    texts = ["%05d" % i for i in range(100, 160)]
+    assert app.translate_texts(texts) == [t + "_translated" for t in texts]
+    assert [len(call) for call in dummy.calls] == [20, 20, 20]
+
+
+def test_translate_texts_failure(monkeypatch):
+    monkeypatch.setattr(app, "translator", DummyBatchTranslator())
+    assert app.translate_texts(["ok", "error"]) == ["", ""]
+
+
+def test_translate_texts_uses_cache(monkeypatch):
+    dummy = DummyBatchTranslator()
+    monkeypatch.setattr(app, "translator", dummy)
+    app.translate_texts(["a"])
+    assert app.translate_texts(["a", "b"]) == ["a_translated", "b_translated"]
+    assert dummy.calls == [["a"], ["b"]]
+
+
+def test_translation_cache_persists(monkeypatch):
+    app.translate_text("hello")
+    app.TranslationCache.save()
+    monkeypatch.setattr(app.TranslationCache, "entries", None)
+    monkeypatch.setattr(app, "translator", None)
+    assert app.translate_text("hello") == "hello_translated"
+
+
+def test_request_throttle_spaces_requests(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(app.RequestThrottle, "next_at", 0.0)
+    monkeypatch.setattr(app.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(app.time, "sleep", sleeps.append)
+    for _ in range(3):
+        app.RequestThrottle.wait()
+    assert sleeps == pytest.approx([0.05, 0.1])
+
+
+def test_request_throttle_limits_concurrency(monkeypatch):
+    slots = app.threading.BoundedSemaphore(1)
+    monkeypatch.setattr(app.RequestThrottle, "slots", slots)
+    monkeypatch.setattr(app.RequestThrottle, "interval", 0)
+    with app.RequestThrottle.request():
+        assert not slots.acquire(blocking=False)
+    assert slots.acquire(blocking=False)
+
+
+def test_translation_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(app.TranslationCache, "max_entries", 2)
+    app.TranslationCache.put("a", "PL", "EN-GB", "A")
+    app.TranslationCache.put("b", "PL", "EN-GB", "B")
+    assert app.TranslationCache.get("a", "PL", "EN-GB") == "A"
+    app.TranslationCache.put("c", "PL", "EN-GB", "C")
+    assert app.TranslationCache.get("b", "PL", "EN-GB") is None
+    assert app.TranslationCache.get("a", "PL", "EN-GB") == "A"
+    assert app.TranslationCache.get("c", "PL", "EN-GB") == "C"
+
+
+def test_known_translation_follows_edits(monkeypatch):
+    dummy = DummyBatchTranslator()
+    monkeypatch.setattr(app, "translator", dummy)
+    ta = app.TranslationApp.__new__(app.TranslationApp)
+    ta.pl_data = {"a": {"b": "Zapisz", "c": "Anuluj"}, "d": "Nowy"}
+    ta.en_data = {"a": {"b": "Sve", "c": ""}}
+    ta._data_changed()
+    assert ta.known_translation("Zapisz") == "Sve"
+    assert ta.known_translation("Anuluj") == ""
+    assert app.translate_texts(["Zapisz"]) == ["Zapisz_translated"]
+    assert dummy.calls == [["Zapisz"]]
+    ta.en_data["a"]["b"] = "Save"
+    ta._data_changed()
+    assert ta.known_translation("Zapisz") == "Save"
+
+
 # -----------------------------
 # Integration: change_files
 # -----------------------------
@@ -117,6 +404,7 @@ def test_change_files_persists_config(tmp_path, monkeypatch):
     saved = json.loads(config.read_text(encoding="utf-8"))
     assert saved["pl_file"].endswith("new_pl.json")
     assert saved["en_file"].endswith("new_en.json")
+    assert ta.title().endswith("new_pl.json & new_en.json | Translations: 0")
 
 
 def test_change_files_cancelled(tmp_path, monkeypatch):
@@ -144,6 +432,7 @@ def test_save_updates_files_and_message(tmp_path, monkeypatch):
     ta = app.TranslationApp(str(pl), str(en))
     ta.pl_data["foo"] = "bar"
     ta.en_data["baz"] = "qux"
+    ta._data_changed()
     info_called = {}
     monkeypatch.setattr(
         messagebox,
@@ -156,6 +445,51 @@ def test_save_updates_files_and_message(tmp_path, monkeypatch):
     assert "Updated" in info_called["title"] or "Updated" in info_called["msg"]
 
 
+def test_save_skips_unchanged_files(tmp_path, monkeypatch):
+    pl = tmp_path / "p.json"
+    en = tmp_path / "e.json"
+    pl.write_text(json.dumps({"a": "x"}), encoding="utf-8")
+    en.write_text(json.dumps({"a": "y"}), encoding="utf-8")
+    ta = app.TranslationApp.__new__(app.TranslationApp)
+    ta.pl_path, ta.en_path = str(pl), str(en)
+    ta._load_data()
+    messages = []
+    monkeypatch.setattr(messagebox, "showinfo", lambda t, m: messages.append(m))
+    written = []
+    real_write = app._write_bytes
+    monkeypatch.setattr(
+        app, "_write_bytes", lambda raw, p: (written.append(p), real_write(raw, p))
+    )
+
+    ta.save()
+    assert written == []
+    ta.en_data["a"] = "z"
+    ta._data_changed()
+    ta.save()
+    assert written == [str(en)]
+    assert json.loads(en.read_text())["a"] == "z"
+    ta.save()
+    assert written == [str(en)]
+    assert messages[-1] == "No changes to save."
+
+
+def test_save_same_file_for_both_languages(tmp_path, monkeypatch):
+    path = tmp_path / "both.json"
+    path.write_text(json.dumps({"a": "x"}), encoding="utf-8")
+    ta = app.TranslationApp.__new__(app.TranslationApp)
+    ta.pl_path = str(path)
+    ta.en_path = str(tmp_path / "." / "both.json")
+    ta._load_data()
+    monkeypatch.setattr(messagebox, "showinfo", lambda t, m: None)
+    monkeypatch.setattr(app.concurrent.futures, "ThreadPoolExecutor", None)
+    ta.pl_data["a"] = "p"
+    ta.en_data["a"] = "e"
+    ta._data_changed()
+    ta.save()
+    assert json.loads(path.read_text()) == {"a": "e"}
+    assert [p.name for p in tmp_path.iterdir()] == ["both.json"]
+
+
 # -----------------------------
 # Test on_tree_click
 # -----------------------------
@@ -226,17 +560,143 @@ def test_adddialog_toggle_behavior(monkeypatch):
 
 
 # -----------------------------
-# Tests for finish_insert and main()
+# Tests for translation batches and main()
 # -----------------------------
-def test_finish_insert_updates_data(tmp_path):
+def test_batch_done_updates_data_and_undo_entry(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "QUIET", True)
     pl = tmp_path / "p.json"
     en = tmp_path / "e.json"
     pl.write_text(json.dumps({}))
     en.write_text(json.dumps({}))
     ta = app.TranslationApp(str(pl), str(en))
     parts = ["a", "b"]
-    ta.finish_insert(parts, "hello")
+    op = app.AddOp(parts, "czesc")
+    future = app.concurrent.futures.Future()
+    future.set_result(["hello"])
+    ta._batch_done([(parts, "czesc", op)], future)
+    ta.update()
     assert app.get_nested(ta.en_data, parts) == "hello"
+    assert op.en == "hello"
+
+
+# -----------------------------
+# Tree patching on a real Treeview
+# -----------------------------
+@pytest.fixture
+def tk_app(tmp_path):
+    apps = []
+
+    def make(pl_data, en_data):
+        pl = tmp_path / "p.json"
+        en = tmp_path / "e.json"
+        pl.write_text(json.dumps(pl_data), encoding="utf-8")
+        en.write_text(json.dumps(en_data), encoding="utf-8")
+        ta = app.TranslationApp(str(pl), str(en))
+        apps.append(ta)
+        return ta
+
+    yield make
+    for ta in apps:
+        ta.on_close()
+
+
+def child_keys(ta, item=""):
+    return [ta.tree.set(child, "full_key") for child in ta.tree.get_children(item)]
+
+
+def open_branch(ta, full):
+    node = ta._node_by_key[full]
+    ta.tree.focus(node)
+    ta._on_open()
+    return node
+
+
+def search(ta, text):
+    # Run the debounced search right away
+    ta.search_var.set(text)
+    ta.after_cancel(ta._search_job)
+    ta._apply_search()
+
+
+def test_add_undo_redo_patches_tree(tk_app, monkeypatch):
+    ta = tk_app({"menu": {"open": "Otworz"}}, {"menu": {"open": "Open"}})
+    menu = open_branch(ta, "menu")
+
+    class FakeDialog:
+        def __init__(self, *args, **kwargs):
+            self.result = {
+                "key": "menu.save",
+                "pl": "Zapisz",
+                "auto": False,
+                "en": "Save",
+            }
+
+    monkeypatch.setattr(app, "AddDialog", FakeDialog)
+    ta.add_new()
+    assert child_keys(ta, menu) == ["menu.open", "menu.save"]
+    row = ta._node_by_key["menu.save"]
+    texts = [ta.tree.item(r, "text") for r in ta.tree.get_children(row)]
+    assert texts == ["[PL] Zapisz", "[EN] Save"]
+
+    ta.undo_last()
+    assert child_keys(ta, menu) == ["menu.open"]
+    assert "menu.save" not in ta._node_by_key
+    assert not ta.tree.exists(row)
+
+    ta.redo_last()
+    assert child_keys(ta, menu) == ["menu.open", "menu.save"]
+    assert ta.tree.parent(ta._node_by_key["menu.save"]) == menu
+
+
+def test_delete_last_leaf_of_branch_then_undo(tk_app, monkeypatch):
+    ta = tk_app({"menu": {"open": "Otworz"}, "title": "Tytul"}, {})
+    open_branch(ta, "menu")
+    ta.tree.selection_set(ta._node_by_key["menu.open"])
+    monkeypatch.setattr(messagebox, "askyesno", lambda *a: True)
+
+    ta.delete_selected()
+    assert ta.pl_data == {"title": "Tytul"}
+    assert child_keys(ta) == ["title"]
+    assert "menu" not in ta._node_by_key
+
+    ta.undo_last()
+    assert child_keys(ta) == ["menu", "title"]
+    open_branch(ta, "menu")
+    assert child_keys(ta, ta._node_by_key["menu"]) == ["menu.open"]
+
+    ta.redo_last()
+    assert child_keys(ta) == ["title"]
+    assert "menu" not in ta._node_by_key and "menu.open" not in ta._node_by_key
+
+
+def test_search_then_rebuild_keeps_filter_and_frees_hidden_rows(tk_app):
+    ta = tk_app({"a": {"x": "apple"}, "b": {"y": "banana"}}, {})
+    search(ta, "apple")
+    assert child_keys(ta) == ["a"]
+
+    hidden = ta._node_by_key["b"]
+    ta.insert_all()
+    assert child_keys(ta) == ["a"]
+    assert not ta.tree.exists(hidden)
+
+    search(ta, "")
+    assert child_keys(ta) == ["a", "b"]
+
+
+def test_expanding_placeholder_branch(tk_app):
+    ta = tk_app({"menu": {"open": "O", "sub": {"k": "v"}}}, {})
+    menu = ta._node_by_key["menu"]
+    (placeholder,) = ta.tree.get_children(menu)
+    assert ta.tree.item(placeholder, "text") == "…"
+
+    open_branch(ta, "menu")
+    assert child_keys(ta, menu) == ["menu.open", "menu.sub"]
+    assert not ta.tree.exists(placeholder)
+    assert "menu" not in ta._placeholders and "menu.sub" in ta._placeholders
+
+    ta.select_key("menu.sub.k")
+    assert ta.tree.selection() == (ta._node_by_key["menu.sub.k"],)
+    assert ta.tree.item(ta._node_by_key["menu.sub"], "open")
 
 
 def test_main_saves_config(monkeypatch, tmp_path):
@@ -375,82 +835,6 @@ def test_edit_selected_changes_key_and_translations(monkeypatch):
     assert ta.en_data["alpha"]["beta"] == "EN_new"
 
 
-# -----------------------------
-# Tests for preserving & restoring expanded nodes in the Treeview
-# -----------------------------
-class FakeTree:
-    def __init__(self, structure, open_keys):
-        self.structure = structure
-        self._open = {node: (node in open_keys) for node in structure}
-        self._full_key = {node: node for node in structure}
-
-    def get_children(self, item=""):
-        return self.structure.get(item, [])
-
-    def item(self, item, option=None, **kwargs):
-        if "open" in kwargs:
-            self._open[item] = kwargs["open"]
-        if option == "open":
-            return self._open[item]
-        return None
-
-    def set(self, item, column):
-        if column == "full_key":
-            return self._full_key[item]
-        return None
-
-
-class DummyApp(app.TranslationApp):
-    def __init__(self):
-        pass
-
-
-def test_get_expanded_keys_simple():
-    structure = {"": ["A", "B"], "A": ["A1"], "A1": [], "B": ["B1"], "B1": []}
-    open_keys = {"A", "B1"}
-    fake = FakeTree(structure, open_keys)
-    ta = DummyApp()
-    ta.tree = fake
-
-    got = app.TranslationApp.get_expanded_keys(ta)
-    assert got == open_keys
-
-
-def test_restore_expanded_keys_simple():
-    structure = {"": ["X", "Y"], "X": [], "Y": []}
-    fake = FakeTree(structure, {"X"})
-    ta = DummyApp()
-    ta.tree = fake
-
-    for node in ["X", "Y"]:
-        fake._open[node] = False
-
-    app.TranslationApp.restore_expanded_keys(ta, {"X"})
-
-    assert fake._open["X"] is True
-    assert fake._open["Y"] is False
-
-
-def test_roundtrip_expand_and_restore():
-    structure = {"": ["N1", "N2"], "N1": ["N1a", "N1b"], "N1a": [], "N1b": [], "N2": []}
-    initial_open = {"N1", "N1b"}
-    fake = FakeTree(structure, initial_open)
-    ta = DummyApp()
-    ta.tree = fake
-
-    saved = app.TranslationApp.get_expanded_keys(ta)
-    assert saved == initial_open
-
-    for n in initial_open:
-        fake._open[n] = False
-
-    app.TranslationApp.restore_expanded_keys(ta, saved)
-
-    for n in ["N1", "N1b"]:
-        assert fake._open[n] is True
-    assert fake._open["N2"] is False
-
-
 # -----------------------------
 # Tests for AddDialog.validate()
 # -----------------------------